@@ -1,11 +1,14 @@
 # -*- coding: utf-8 -*-
 """Top level package for recursiveseriation"""
 
-import pandas as pd
+import threading
 
 from cpilatam.logger import configure_logging
-from cpilatam.names import Countries, CPIColumns
+from cpilatam.names import Countries
+from cpilatam.release import is_stale
 from cpilatam.settings import init_settings
+from cpilatam.snapshot import publish
+from cpilatam.storage import modification_time, read_cpi_csv
 
 __app_name__ = "cpilatam"
 __version__ = "2023.11.1"
@@ -13,24 +16,54 @@ __version__ = "2023.11.1"
 SETTINGS = init_settings()
 logger = configure_logging(__app_name__ + " - v" + __version__, SETTINGS, kidnap_loggers=True)
 
-DF_CPI = {
-    Countries.PERU.value: pd.read_csv(SETTINGS.PERU_LOCAL_PATH.as_posix()),
-    Countries.COLOMBIA.value: pd.read_csv(SETTINGS.COLOMBIA_LOCAL_PATH.as_posix()),
+LOCAL_PATHS = {
+    Countries.PERU.value: SETTINGS.PERU_LOCAL_PATH.as_posix(),
+    Countries.COLOMBIA.value: SETTINGS.COLOMBIA_LOCAL_PATH.as_posix(),
+    Countries.CHILE.value: SETTINGS.CHILE_LOCAL_PATH.as_posix(),
 }
 
+# taken before reading, so a file replaced in between is reloaded by the next update
+DATA_MTIMES = {country: modification_time(path) for country, path in LOCAL_PATHS.items()}
+DF_CPI = {country: read_cpi_csv(path) for country, path in LOCAL_PATHS.items()}
+
+RELEASE_DAYS = {
+    Countries.PERU.value: SETTINGS.PERU_RELEASE_DAY,
+    Countries.COLOMBIA.value: SETTINGS.COLOMBIA_RELEASE_DAY,
+    Countries.CHILE.value: SETTINGS.CHILE_RELEASE_DAY,
+}
+
+_UPDATE_LOCK = threading.Lock()
+
 for key, item in DF_CPI.items():
-    if item[CPIColumns.DATE.value].max() <= pd.to_datetime("today").strftime("%Y-%m-%d"):
+    publish(key, item)
+    if is_stale(item, RELEASE_DAYS[key]):
         logger.warn(f"The data is not up to date in the {key} country. Please run the update script.")
 
 
 def update(countries: list = None):
+    """Updates the CPI data of the countries, publishing a new snapshot for each one that changed.
+
+    ``DF_CPI`` is kept in sync for compatibility, concurrent readers should use
+    :func:`cpilatam.snapshot.get_snapshot` to get a consistent view without locks.
+    """
     from cpilatam.parsers import __parsers__
 
     if countries is None:
         countries = DF_CPI.keys()
-    for parser in __parsers__:
-        if parser.country in countries:
-            logger.info(f"Updating {parser.country} data...")
-            parser.update()
-            # replace the dataframe in the DF_CPI dictionary
-            DF_CPI[parser.country] = parser.data
+    # serialize updates (e.g. the background refresher and a manual call) on the shared parsers
+    with _UPDATE_LOCK:
+        for parser in __parsers__:
+            if parser.country in countries:
+                logger.info(f"Updating {parser.country} data...")
+                if parser.data is None:
+                    # start from the published data, so only new data is published again
+                    parser.data, parser.data_mtime = DF_CPI[parser.country], DATA_MTIMES[parser.country]
+                if parser.update():
+                    snapshot = publish(parser.country, parser.data)
+                    DF_CPI[parser.country] = snapshot.data
+
+
+if SETTINGS.AUTO_REFRESH:
+    from cpilatam.refresher import start_auto_refresh
+
+    REFRESHER = start_auto_refresh()
@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+"""This module converts the CPI frames into the dataframe library selected in the settings."""
+
+from typing import Optional, Union
+
+import pandas as pd
+
+from cpilatam import SETTINGS
+from cpilatam.exc import BackendNotInstalled
+from cpilatam.settings import Backend
+
+try:
+    import pyarrow as pa
+
+    PYARROW_INSTALLED = True
+
+except ImportError:
+    PYARROW_INSTALLED = False
+
+try:
+    import polars as pl
+
+    POLARS_INSTALLED = True
+
+except ImportError:
+    POLARS_INSTALLED = False
+
+# the libraries are optional, so their types are only referenced by name
+CPIFrame = Union[pd.DataFrame, "pa.Table", "pl.DataFrame"]
+
+
+def to_backend(data: pd.DataFrame, backend: Optional[str] = None) -> CPIFrame:
+    """Converts a pandas DataFrame into the requested dataframe library.
+
+    The numeric and datetime columns of the CPI frames are backed by contiguous numpy
+    arrays, so Arrow wraps their buffers and Polars wraps the Arrow ones without copies.
+
+    Args:
+        data (pd.DataFrame): The frame to convert.
+        backend (str, optional): The dataframe library. Defaults to ``SETTINGS.BACKEND``.
+
+    Returns:
+        pd.DataFrame, pa.Table or pl.DataFrame: The data in the requested library.
+    """
+    backend = Backend(SETTINGS.BACKEND if backend is None else backend)
+    if backend == Backend.PANDAS or data is None:
+        return data
+
+    if not PYARROW_INSTALLED:
+        raise BackendNotInstalled(backend=backend.value, package="pyarrow", extra=backend.value.lower())
+    table = pa.Table.from_pandas(data, preserve_index=False)
+    if backend == Backend.ARROW:
+        return table
+
+    if not POLARS_INSTALLED:
+        raise BackendNotInstalled(backend=backend.value, package="polars", extra=backend.value.lower())
+    return pl.from_arrow(table, rechunk=False)
@@ -0,0 +1,122 @@
+# -*- coding: utf-8 -*-
+"""This module contains the daily CPI index used for day-level indexation."""
+
+import numpy as np
+import pandas as pd
+
+from cpilatam.names import CPIColumns, InterpolationRule
+from cpilatam.snapshot import get_snapshot
+
+
+class DailyIndex:
+    """Daily index interpolated from a monthly CPI series.
+
+    The index is precomputed as one float per day, so bulk queries are a single
+    vectorized gather.
+
+    Example:
+        >>> index = DailyIndex(get_snapshot("chile").data, rule=InterpolationRule.LAGGED, lag=1)
+        >>> index.indexate([1000.0], ["2023-01-15"], ["2023-06-15"])
+        array([1018.24533516])
+    """
+
+    def __init__(self, data: pd.DataFrame, rule: InterpolationRule = InterpolationRule.GEOMETRIC, lag: int = 1):
+        """Builds the daily index.
+
+        Args:
+            data (pd.DataFrame): A monthly CPI series with the universal schema.
+            rule (InterpolationRule): How the days within a month are valued.
+            lag (int): Months between a CPI and the days it applies to, only for ``LAGGED``.
+
+        Attributes:
+            rule (InterpolationRule): The interpolation rule.
+            lag (int): The lag in months.
+            start (np.datetime64): The first day of the index.
+            values (np.ndarray): The index value of each day since ``start``.
+        """
+        self.rule = InterpolationRule(rule)
+        self.lag = lag if self.rule == InterpolationRule.LAGGED else 0
+
+        months = pd.to_datetime(data[CPIColumns.DATE.value]).to_numpy().astype("datetime64[M]")
+        cpi = data[CPIColumns.CPI.value].to_numpy(dtype=float)
+        order = np.argsort(months)
+        months, cpi = months[order] + self.lag, cpi[order]
+
+        # spread the series over every month between its ends, carrying the last value over gaps
+        positions = (months - months[0]).astype("int64")
+        monthly = np.full(positions[-1] + 1, np.nan)
+        monthly[positions] = cpi
+        monthly = monthly[np.maximum.accumulate(np.where(np.isnan(monthly), 0, np.arange(monthly.size)))]
+
+        month_starts = np.arange(months[0], months[0] + monthly.size + 1).astype("datetime64[D]")
+        month_lengths = np.diff(month_starts).astype("int64")
+        self.start: np.datetime64 = month_starts[0]
+
+        if self.rule == InterpolationRule.STEP:
+            self.values: np.ndarray = np.repeat(monthly, month_lengths)
+        else:
+            # every month but the last one grows towards the next CPI, the last one only has its first day
+            lengths = month_lengths[:-1]
+            month_of_day = np.repeat(np.arange(lengths.size), lengths)
+            day_of_month = np.arange(month_of_day.size) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+            log_cpi = np.log(monthly)
+            growth = (log_cpi[1:] - log_cpi[:-1])[month_of_day]
+            interpolated = np.exp(log_cpi[month_of_day] + growth * day_of_month / lengths[month_of_day])
+            self.values = np.append(interpolated, monthly[-1])
+
+    @property
+    def end(self) -> np.datetime64:
+        """The last day of the index."""
+        return self.start + (self.values.size - 1)
+
+    def values_at(self, dates) -> np.ndarray:
+        """Returns the index value of each date, NaN for dates outside of the index.
+
+        Args:
+            dates (array-like): Dates in any format accepted by ``np.asarray(..., dtype="datetime64[D]")``.
+
+        Returns:
+            np.ndarray: The index values.
+        """
+        days = np.asarray(dates, dtype="datetime64[D]")
+        positions = (days - self.start).astype("int64")
+        valid = ~np.isnat(days) & (positions >= 0) & (positions < self.values.size)
+        result = np.full(days.shape, np.nan)
+        result[valid] = self.values[positions[valid]]
+        return result
+
+    def indexate(self, amounts, from_dates, to_dates) -> np.ndarray:
+        """Indexates amounts from one date to another.
+
+        Args:
+            amounts (array-like): The amounts valued at ``from_dates``.
+            from_dates (array-like): The dates of the amounts.
+            to_dates (array-like): The dates to carry the amounts to.
+
+        Returns:
+            np.ndarray: The amounts valued at ``to_dates``, NaN when a date is outside of the index.
+        """
+        return np.asarray(amounts, dtype=float) * self.values_at(to_dates) / self.values_at(from_dates)
+
+    def to_series(self) -> pd.Series:
+        """Returns the daily index as a pandas Series indexed by date."""
+        days = np.arange(self.start, self.start + self.values.size)
+        return pd.Series(self.values, index=pd.DatetimeIndex(days, name=CPIColumns.DATE.value))
+
+
+def get_daily_index(
+    country: str, rule: InterpolationRule = InterpolationRule.GEOMETRIC, lag: int = 1
+) -> DailyIndex:
+    """Returns the daily index of a country, cached in the snapshot of its monthly data.
+
+    Args:
+        country (str): The country, a key of ``DF_CPI``.
+        rule (InterpolationRule): How the days within a month are valued.
+        lag (int): Months between a CPI and the days it applies to, only for ``LAGGED``.
+
+    Returns:
+        DailyIndex: The daily index.
+    """
+    rule = InterpolationRule(rule)
+    snapshot = get_snapshot(country)
+    return snapshot.cached(("daily", rule, lag), lambda: DailyIndex(snapshot.data, rule=rule, lag=lag))
@@ -60,3 +60,33 @@ class EnvVarNotFound(CPIBaseException, NameError):
     """Raise this when a table name has not been found."""
 
     msg_template = "Enviroment variable `{env_var}` can't be found"
+
+
+class ReferenceDateNotFound(CPIBaseException, ValueError):
+    """Raise this when the reference date can't be extracted from the source data."""
+
+    msg_template = "Reference date can't be found in `{text}`"
+
+
+class CPIValuesNotFound(CPIBaseException, ValueError):
+    """Raise this when the source data has no valid CPI value."""
+
+    msg_template = "No valid CPI value found for `{country}`"
+
+
+class BackendNotInstalled(CPIBaseException, ImportError):
+    """Raise this when the package required by a backend is not installed."""
+
+    msg_template = "Backend `{backend}` requires `{package}`, install it with ``pip install cpilatam[{extra}]``"
+
+
+class CountryNotSupported(CPIBaseException, ValueError):
+    """Raise this when a country has no CPI data in the package."""
+
+    msg_template = "Country `{country}` is not supported, expected one of `{countries}`"
+
+
+class UnsupportedSpec(CPIBaseException, ValueError):
+    """Raise this when a parser meets a source format or date layout it can't handle."""
+
+    msg_template = "`{parser}` does not support the {name} `{value}`"
@@ -17,3 +17,43 @@ class Countries(Enum):
 
     PERU = "peru"
     COLOMBIA = "colombia"
+    CHILE = "chile"
+
+
+class SourceFormat(Enum):
+    """Enum for the formats in which the sources publish the CPI data."""
+
+    EXCEL = "excel"
+    """A spreadsheet readable by ``pd.read_excel``."""
+
+    HTML_TABLE = "html_table"
+    """A table inside a web page."""
+
+    JSON = "json"
+    """A JSON document, the parser of the source must override ``read`` for it."""
+
+
+class DateLayout(Enum):
+    """Enum for the ways the sources lay out the dates of the CPI table."""
+
+    MONTH_YEAR_LABEL = "month_year_label"
+    """One row per month labeled like ``Ene91`` or ``Ene.1991``."""
+
+    YEAR_MONTH_COLUMNS = "year_month_columns"
+    """One row per month with the year and the month in two columns."""
+
+    MONTH_BY_YEAR = "month_by_year"
+    """One row per month name and one column per year."""
+
+
+class InterpolationRule(Enum):
+    """Enum for the rules that turn a monthly CPI series into a daily index."""
+
+    GEOMETRIC = "geometric"
+    """Constant daily growth from the CPI of a month to the CPI of the next one."""
+
+    STEP = "step"
+    """The CPI of the month for every day of the month."""
+
+    LAGGED = "lagged"
+    """Geometric interpolation of the CPI published ``lag`` months before, similar to Chile's UF."""
@@ -1,4 +1,5 @@
+from cpilatam.parsers.chile import ChileCPIParser
 from cpilatam.parsers.colombia import ColombiaCPIParser
 from cpilatam.parsers.peru import PeruCPIParser
 
-__parsers__ = [ColombiaCPIParser(), PeruCPIParser()]
+__parsers__ = [ColombiaCPIParser(), PeruCPIParser(), ChileCPIParser()]
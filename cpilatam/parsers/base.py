@@ -1,17 +1,128 @@
 # -*- coding: utf-8 -*-
 """This module contains the base class for CPI parsers."""
 
-from abc import ABC, abstractmethod
+import hashlib
+import io
+import re
+import time
+from abc import ABC
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass
 from datetime import date
+from itertools import groupby
+from operator import attrgetter
+from pathlib import Path
+from typing import ClassVar, List, Optional, Tuple
+from urllib.parse import urlparse
+from urllib.request import url2pathname
 
+import numpy as np
 import pandas as pd
+import requests
+from bs4 import BeautifulSoup
 from pandera.typing import DataFrame
 
-from cpilatam.schemas import CPI_SCHEMA
+from cpilatam import SETTINGS, logger
+from cpilatam.backends import CPIFrame, to_backend
+from cpilatam.exc import CPIValuesNotFound, ReferenceDateNotFound, UnsupportedSpec
+from cpilatam.names import CPIColumns, DateLayout, SourceFormat
+from cpilatam.schemas import CPI_SCHEMA, TYPED_CPI_SCHEMA
+from cpilatam.storage import (
+    atomic_write_csv,
+    atomic_write_json,
+    file_lock,
+    modification_time,
+    read_cpi_csv,
+    read_json,
+)
+
+# the extension of the payloads of each format in the mirror directory
+MIRROR_EXTENSIONS = {
+    SourceFormat.EXCEL: ".xlsx",
+    SourceFormat.HTML_TABLE: ".html",
+    SourceFormat.JSON: ".json",
+}
+
+REQUEST_TIMEOUT = 30
+
+# bump it when the parsing changes, so the payloads already parsed are parsed again
+PARSER_VERSION = 1
+
+
+@dataclass(frozen=True)
+class Source:
+    """An endpoint publishing the raw CPI table of a country.
+
+    Attributes:
+        url (str): The url of the payload, ``file://`` urls are read from the local disk.
+        source_format (SourceFormat): The format of the payload.
+        release (str): The release published by the endpoint. Consecutive sources of the
+            same release publish the same data and are hedged, see ``BaseCPIParser.fetch``.
+    """
+
+    url: str
+    source_format: SourceFormat
+    release: str = "latest"
+
+
+@dataclass(frozen=True)
+class Download:
+    """A payload received from a source and the data parsed from it.
+
+    Attributes:
+        source (Source): The source of the payload.
+        payload (bytes): The raw payload.
+        payload_hash (str): The sha256 of the payload.
+        raw (pd.DataFrame): The raw table, None if the payload was already parsed.
+        data (pd.DataFrame): The data with the universal schema, None if the payload was already parsed.
+        reference_date (pd.Timestamp): The reference date of the data.
+    """
+
+    source: Source
+    payload: bytes
+    payload_hash: str
+    raw: Optional[pd.DataFrame] = None
+    data: Optional[pd.DataFrame] = None
+    reference_date: Optional[pd.Timestamp] = None
+
+
+@dataclass(frozen=True)
+class ParserSpec:
+    """Declarative description of where and how a source publishes its CPI table.
+
+    Row and column positions refer to the raw DataFrame returned by ``download``.
+
+    Attributes:
+        date_layout (DateLayout): How the dates of the table are laid out.
+        rows (tuple): The (start, stop) rows of the table, None for an open end.
+            For ``MONTH_BY_YEAR`` the first row holds the years.
+        date_columns (tuple): The columns holding the dates, the month label, or the year and
+            the month for ``YEAR_MONTH_COLUMNS``. For ``MONTH_BY_YEAR`` the month names column,
+            every other column holds the values of one year.
+        value_column (int): The column holding the CPI values.
+        reference_date_cell (tuple): The (row, column) holding the reference date text,
+            the row is None when the text is in the column header.
+        reference_date_pattern (str): A regex with a ``year`` group and an optional ``month`` group.
+        table_selector (str): CSS selector of the table, only for ``HTML_TABLE`` sources.
+    """
+
+    date_layout: DateLayout
+    rows: Tuple[Optional[int], Optional[int]] = (None, None)
+    date_columns: Tuple[int, ...] = (0,)
+    value_column: int = 1
+    reference_date_cell: Tuple[Optional[int], int] = (None, 1)
+    reference_date_pattern: str = r"(?P<year>\d{4})"
+    table_selector: Optional[str] = None
 
 
 class BaseCPIParser(ABC):
-    """Base class for CPI parsers."""
+    """Base class for CPI parsers.
+
+    Subclasses describe their source with a ``spec`` and get the download and the
+    vectorized normalization into the universal schema for free.
+    """
+
+    spec: ClassVar[ParserSpec]
 
     month_map = {
         # Peru format
@@ -42,55 +153,525 @@ class BaseCPIParser(ABC):
         "Diciembre": 12,
     }
 
-    def __init__(self, local_file_path: str, url: str, country: str):
+    def __init__(self, local_file_path: str, sources: Optional[List[Source]], country: str):
         """Initializes the parser.
 
         Args:
             local_file_path (str): The path to the local file.
-            url (str): The url to the source data.
+            sources (list): The endpoints of the source data, in order of preference.
+                None for parsers that override ``build_sources``.
             country (str): The country of the CPI data.
 
         Attributes:
             local_file_path (str): The path to the local file.
-            url (str): The url to the source data.
+            source (Source): The endpoint of the last payload downloaded, the first one until then.
+            last_download (Download): The result of the last ``download``, parsed while validating it.
             data (pd.DataFrame): The data in a pandas DataFrame with the universal schema.
+            data_mtime (int): The modification time of the local file ``data`` was loaded from or saved to.
+            payload (bytes): The raw payload of the last download.
             reference_date (date): The reference/pivot for the CPI values.
             country (str): The country of the CPI data.
         """
         self.local_file_path: str = local_file_path
-        self.url: str = url
+        self.country: str = country
+        self._sources: Optional[List[Source]] = None if sources is None else list(sources)
+        self._sources_override: Optional[List[Source]] = None
+        self.source: Optional[Source] = next(iter(self.sources), None)
+        self.last_download: Optional[Download] = None
         self.data: pd.DataFrame = None
+        self.data_mtime: Optional[int] = None
+        self.payload: bytes = None
         self.reference_date: date = None
-        self.country: str = country
 
-    @abstractmethod
+    def build_sources(self) -> List[Source]:
+        """Returns the endpoints of the source data, in order of preference.
+
+        It is called on every ``fetch``, parsers whose urls depend on the date override it.
+        """
+        return list(self._sources or [])
+
+    @property
+    def sources(self) -> List[Source]:
+        """The endpoints of the source data, in order of preference.
+
+        The mirror in ``SETTINGS.MIRROR_PATH`` is added as the last one. Assigning a list
+        replaces all of them, mirror included.
+        """
+        if self._sources_override is not None:
+            return list(self._sources_override)
+        sources = self.build_sources()
+        if SETTINGS.MIRROR_PATH is not None and sources:
+            source_format = sources[0].source_format
+            mirror = Path(SETTINGS.MIRROR_PATH, self.country + MIRROR_EXTENSIONS[source_format]).resolve()
+            sources.append(Source(url=mirror.as_uri(), source_format=source_format, release="mirror"))
+        return sources
+
+    @sources.setter
+    def sources(self, sources: List[Source]) -> None:
+        self._sources_override = list(sources)
+
     def parse(self) -> None:
         """Parses the source cpi data into a pandas DataFrame with the universal schema.
 
+        The raw table returned by ``download`` was already parsed to validate it, that result is reused.
+        """
+        logger.info(f"Parsing the data of {self.country}")
+        download = self.last_download
+        if download is not None and download.data is not None and self.data is download.raw:
+            self.data, self.reference_date = download.data, download.reference_date
+        elif self.data is not None:
+            self.data, self.reference_date = self.parse_raw(self.data)
+        else:
+            logger.info("No data to parse. Please run the 'download' method first.")
+            return None
+
+    def download(self) -> None:
+        """Downloads the data from the sources and stores the raw table in the self.data attribute."""
+        download = self.fetch()
+        self.last_download = download
+        self.payload = None if download is None else download.payload
+        self.data = None if download is None else download.raw
+
+    def fetch(
+        self, payload_hash: Optional[str] = None, not_before: Optional[pd.Timestamp] = None
+    ) -> Optional[Download]:
+        """Downloads and parses the payload of the first source that returns valid data.
+
+        Consecutive sources of the same release publish the same data: they are requested
+        in order, and when one fails or has not answered after ``SETTINGS.HEDGE_DELAY``
+        seconds the next one is requested as well. The first valid payload wins and the
+        requests still running are abandoned. Different releases (e.g. the monthly DANE
+        files or the mirror) are tried one after the other, so an older release is only
+        used when the newer ones fail.
+
+        Args:
+            payload_hash (str, optional): The sha256 of a payload already parsed, accepted without parsing.
+            not_before (pd.Timestamp, optional): Data ending before this date is rejected.
+
+        Returns:
+            Download: The winning payload and its data, or None if no source returned valid data.
+        """
+        start = time.perf_counter()
+        for _, sources in groupby(self.sources, key=attrgetter("release")):
+            download = self.fetch_release(list(sources), payload_hash, not_before)
+            if download is not None:
+                logger.info(
+                    f"The {self.country} payload came from {download.source.url} "
+                    f"after {time.perf_counter() - start:.2f}s"
+                )
+                self.source = download.source
+                return download
+        logger.error(f"Failed to retrieve valid {self.country} data from every source.")
+        return None
+
+    def fetch_release(
+        self, sources: List[Source], payload_hash: Optional[str], not_before: Optional[pd.Timestamp]
+    ) -> Optional[Download]:
+        """Hedges the requests to sources publishing the same release, see ``fetch``."""
+        queue = iter(sources)
+        pending = {}
+        pool = ThreadPoolExecutor(max_workers=len(sources), thread_name_prefix="cpilatam-fetch")
+
+        def request_next() -> None:
+            source = next(queue, None)
+            if source is not None:
+                pending[pool.submit(self.download_source, source, payload_hash, not_before)] = source
+
+        try:
+            request_next()
+            while pending:
+                done, _ = wait(pending, timeout=SETTINGS.HEDGE_DELAY, return_when=FIRST_COMPLETED)
+                if not done:
+                    request_next()
+                for future in done:
+                    del pending[future]
+                    download = future.result()
+                    if download is not None:
+                        return download
+                    request_next()
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+        return None
+
+    def download_source(
+        self, source: Source, payload_hash: Optional[str] = None, not_before: Optional[pd.Timestamp] = None
+    ) -> Optional[Download]:
+        """Downloads and parses the payload of one source, see ``fetch``.
+
+        Returns:
+            Download: The payload and its data, or None if the source did not return valid data.
+        """
+        payload = self.fetch_source(source)
+        if payload is None:
+            return None
+        digest = hashlib.sha256(payload).hexdigest()
+        if digest == payload_hash:
+            return Download(source=source, payload=payload, payload_hash=digest)
+        try:
+            raw = self.read(payload, source.source_format)
+            if raw is None:
+                return None
+            logger.info(f"Parsing the data of {self.country} from {source.url}")
+            data, reference_date = self.parse_raw(raw)
+        except Exception as error:  # pylint: disable=broad-except
+            # e.g. an error page served with a 200 status
+            logger.warning("%s did not return valid data: %s", source.url, error)
+            return None
+        last_date = pd.to_datetime(data[CPIColumns.DATE.value]).max()
+        if not_before is not None and last_date < not_before:
+            logger.warning("%s only has data up to %s, older than %s", source.url, last_date, not_before)
+            return None
+        return Download(
+            source=source,
+            payload=payload,
+            payload_hash=digest,
+            raw=raw,
+            data=data,
+            reference_date=reference_date,
+        )
+
+    def fetch_source(self, source: Source) -> Optional[bytes]:
+        """Downloads the raw payload of one source and logs how long it took.
+
+        Args:
+            source (Source): The endpoint to download.
+
+        Returns:
+            bytes: The payload, or None if the source could not be retrieved or is empty.
+        """
+        logger.info("Downloading data from %s", source.url)
+        start = time.perf_counter()
+        payload = None
+        try:
+            if source.url.startswith("file:"):
+                payload = Path(url2pathname(urlparse(source.url).path)).read_bytes()
+            else:
+                response = requests.get(source.url, timeout=REQUEST_TIMEOUT)
+                if response.status_code == 200:
+                    payload = response.content
+                else:
+                    logger.warning("Failed to retrieve %s. Status code: %s", source.url, response.status_code)
+        except (requests.RequestException, OSError) as error:
+            logger.warning("Failed to retrieve %s: %s", source.url, error)
+        logger.info("%s answered in %.2fs", source.url, time.perf_counter() - start)
+        return payload or None
+
+    def read(self, payload: bytes, source_format: Optional[SourceFormat] = None) -> Optional[pd.DataFrame]:
+        """Reads the raw payload into the raw DataFrame expected by ``parse``.
+
+        Excel and HTML table payloads are read here. JSON documents have no common layout,
+        the parsers of JSON sources must override this method.
+
+        Args:
+            payload (bytes): The payload returned by ``fetch``.
+            source_format (SourceFormat, optional): The format of the payload.
+                Defaults to the format of the source that ``fetch`` downloaded.
+
+        Returns:
+            pd.DataFrame: The raw data, or None if the table is not found.
+
+        Raises:
+            UnsupportedSpec: If the format is not read by this parser.
+        """
+        source_format = source_format or self.source.source_format
+        if source_format == SourceFormat.EXCEL:
+            return pd.read_excel(io.BytesIO(payload))
+        if source_format == SourceFormat.HTML_TABLE:
+            table = BeautifulSoup(payload, "html.parser").select_one(self.spec.table_selector)
+            if table is None:
+                logger.error("Table not found on the webpage.")
+                return None
+            return pd.read_html(io.StringIO(str(table)))[0]
+        raise UnsupportedSpec(parser=type(self).__name__, name="source format", value=source_format)
+
+    def set_reference_date(self) -> None:
+        """Extracts the reference date from the cell located by ``spec.reference_date_cell``.
+
+        Example:
+            >>> parser = PeruCPIParser()
+            >>> parser.download()
+            >>> parser.data.columns[1]
+            Índice de precios Lima Metropolitana (índice Dic.2021 = 100) - Índice de Precios al Consumidor (IPC)'
+            >>> parser.set_reference_date()
+            >>> parser.reference_date
+            Timestamp('2021-12-01 00:00:00')
+        """
+        self.reference_date = self.extract_reference_date(self.data)
+
+    def extract_reference_date(self, raw: pd.DataFrame) -> pd.Timestamp:
+        """Returns the reference date written in the raw data, see ``set_reference_date``."""
+        row, column = self.spec.reference_date_cell
+        text = str(raw.columns[column] if row is None else raw.iat[row, column])
+        match = re.search(self.spec.reference_date_pattern, text)
+        if match is None:
+            raise ReferenceDateNotFound(text=text)
+        month = match.groupdict().get("month")
+        month_num = self.month_map[month] if month else 1
+        return pd.Timestamp(year=int(match.group("year")), month=month_num, day=1)
+
+    def parse_raw(self, raw: pd.DataFrame) -> Tuple[DataFrame[CPI_SCHEMA], pd.Timestamp]:
+        """Parses the raw table returned by ``read``, the one path shared by ``parse`` and ``update``.
+
+        Args:
+            raw (pd.DataFrame): The raw data, left unchanged.
+
+        Returns:
+            tuple: The data with the universal schema and its reference date.
+        """
+        reference_date = self.extract_reference_date(raw)
+        return self.normalize(raw, reference_date), reference_date
+
+    def normalize(self, raw: pd.DataFrame, reference_date: pd.Timestamp) -> DataFrame[CPI_SCHEMA]:
+        """Turns the raw source table into a DataFrame with the universal schema.
+
+        The dates after today are dropped, the series is trimmed to its first and last
+        valid values and the gaps in between are forward filled.
+
+        Only one float and one datetime array per row are built from the raw table,
+        every later step works on them in place or on views of them.
+
+        Args:
+            raw (pd.DataFrame): The raw data as returned by ``download``.
+            reference_date (pd.Timestamp): The reference date of the CPI values.
+
         Returns:
             pd.DataFrame: A pandas DataFrame with the universal schema.
         """
-        pass
+        table = raw.iloc[slice(*self.spec.rows)]
+        layout = self.spec.date_layout
+        if layout == DateLayout.MONTH_YEAR_LABEL:
+            labels = table.iloc[:, self.spec.date_columns[0]].to_numpy(dtype=str)
+            # "Ene91", "Ene.1991" and "Enero 1991" all start with the month abbreviation
+            months = self.month_numbers(labels.astype("U3"))
+            years = self.full_years(self.label_years(labels))
+            values = pd.to_numeric(table.iloc[:, self.spec.value_column], errors="coerce")
+        elif layout == DateLayout.YEAR_MONTH_COLUMNS:
+            year_column, month_column = self.spec.date_columns
+            years = pd.to_numeric(table.iloc[:, year_column], errors="coerce")
+            months = self.month_numbers(table.iloc[:, month_column])
+            values = pd.to_numeric(table.iloc[:, self.spec.value_column], errors="coerce")
+        elif layout == DateLayout.MONTH_BY_YEAR:
+            month_column = self.spec.date_columns[0]
+            value_columns = np.delete(np.arange(table.shape[1]), month_column)
+            header_years = pd.to_numeric(table.iloc[0, value_columns], errors="coerce").to_numpy(dtype=float)
+            value_columns = value_columns[~np.isnan(header_years)]
+            header_years = header_years[~np.isnan(header_years)]
+            body = table.iloc[1:]
+            month_names = self.month_numbers(body.iloc[:, month_column])
+            # column-major ravel: every month of a year, year by year, in chronological order
+            years = np.repeat(header_years, month_names.size)
+            months = np.tile(month_names, header_years.size)
+            values = pd.to_numeric(body.iloc[:, value_columns].to_numpy().ravel(order="F"), errors="coerce")
+        else:
+            raise UnsupportedSpec(parser=type(self).__name__, name="date layout", value=layout)
 
-    @abstractmethod
-    def download(self) -> None:
-        """Downloads the raw data from the internet and saves it to a local file in csv format."""
-        pass
+        values = np.asarray(values, dtype=float)
+        # an already float column comes back as a view of the raw table, which must not be filled in place
+        if not values.flags.owndata:
+            values = values.copy()
+        return self.clean(self.month_starts(years, months), values, reference_date)
 
-    def save(self) -> None:
-        """Saves the parsed data to a local csv file."""
-        self.data.to_csv(self.local_file_path, index=False)
+    def clean(
+        self, dates: np.ndarray, values: np.ndarray, reference_date: pd.Timestamp
+    ) -> DataFrame[CPI_SCHEMA]:
+        """Filters, trims and forward fills the series and validates it against the schema.
 
-    def update(self) -> None:
-        """Updates the data by downloading the raw data and reading it into a pandas DataFrame."""
-        self.download()
-        self.parse()
-        self.save()
+        The arrays are owned by the result, ``values`` is forward filled in place.
 
-    def get_data(self) -> DataFrame[CPI_SCHEMA]:
-        """Returns the data in a pandas DataFrame with the universal schema.
+        Args:
+            dates (np.ndarray): The first day of each month, NaT for rows that are not dates.
+            values (np.ndarray): The CPI values, NaN where not available.
+            reference_date (pd.Timestamp): The reference date of the CPI values.
 
         Returns:
             pd.DataFrame: A pandas DataFrame with the universal schema.
         """
-        return self.data
+        today = np.datetime64(pd.Timestamp.now().normalize(), "ns")
+        # NaT never compares lower or equal, so this also drops the rows without date
+        kept = dates <= today
+        valid = np.flatnonzero(kept & ~np.isnan(values))
+        if valid.size == 0:
+            raise CPIValuesNotFound(country=self.country)
+
+        # trimming is a slice, so dates and values stay views; only rows to drop inside it copy them
+        trim = slice(valid[0], valid[-1] + 1)
+        dates, values, kept = dates[trim], values[trim], kept[trim]
+        if not kept.all():
+            dates, values = dates[kept], values[kept]
+
+        # forward fill: every position takes the value of the last valid position before it
+        missing = np.isnan(values)
+        if missing.any():
+            last_valid = np.where(missing, 0, np.arange(values.size))
+            np.maximum.accumulate(last_valid, out=last_valid)
+            values[:] = values[last_valid]
+
+        data = pd.DataFrame(
+            {
+                CPIColumns.DATE.value: dates,
+                CPIColumns.CPI.value: values,
+                CPIColumns.REFERENCE_DATE.value: np.full(dates.size, np.datetime64(reference_date, "ns")),
+            },
+            copy=False,
+        )
+        return TYPED_CPI_SCHEMA.validate(data, inplace=True)
+
+    def month_numbers(self, months) -> np.ndarray:
+        """Converts month numbers or Spanish month names into month numbers, NaN if unknown.
+
+        Each distinct name is looked up once, so the cost does not grow with the rows.
+        """
+        names, positions = np.unique(np.char.strip(np.asarray(months, dtype=str)), return_inverse=True)
+        numbers = pd.to_numeric(pd.Series(names), errors="coerce").to_numpy(dtype=float)
+        numbers[(numbers < 1) | (numbers > 12)] = np.nan
+        numbers = np.where(np.isnan(numbers), [self.month_map.get(name, np.nan) for name in names], numbers)
+        return numbers[positions]
+
+    @staticmethod
+    def label_years(labels: np.ndarray) -> np.ndarray:
+        """Reads the digits of labels like ``Ene91`` or ``Ene.1991`` as a number, NaN without digits.
+
+        Args:
+            labels (np.ndarray): A fixed width unicode array.
+        """
+        if labels.size == 0:
+            return np.zeros(0)
+        # one row of UCS-4 code points per label, read as digits column by column
+        codes = np.ascontiguousarray(labels).view(np.int32).reshape(labels.size, -1) - ord("0")
+        years = np.zeros(labels.size)
+        has_digits = np.zeros(labels.size, dtype=bool)
+        for column in codes.T:
+            digit = (column >= 0) & (column <= 9)
+            years[digit] = years[digit] * 10 + column[digit]
+            has_digits |= digit
+        years[~has_digits] = np.nan
+        return years
+
+    @staticmethod
+    def full_years(years: np.ndarray) -> np.ndarray:
+        """Expands two digit years with the ``%y`` convention: 69-99 are 19xx and 00-68 are 20xx."""
+        years = np.asarray(years, dtype=float)
+        return np.where(years >= 100, years, years + np.where(years >= 69, 1900, 2000))
+
+    @staticmethod
+    def month_starts(years, months) -> np.ndarray:
+        """Builds the first day of each (year, month) pair, NaT where either is missing."""
+        month_index = (np.asarray(years, dtype=float) - 1970) * 12 + np.asarray(months, dtype=float) - 1
+        valid = ~np.isnan(month_index)
+        dates = np.full(month_index.shape, np.datetime64("NaT"), dtype="datetime64[ns]")
+        dates[valid] = month_index[valid].astype("int64").astype("datetime64[M]")
+        return dates
+
+    @property
+    def lock_file_path(self) -> str:
+        """Path to the lock file that coordinates the updates of the local file."""
+        return self.local_file_path + ".lock"
+
+    @property
+    def hashes_file_path(self) -> str:
+        """Path to the file with the hashes of the last payload and data saved."""
+        return self.local_file_path + ".hashes.json"
+
+    def load(self) -> None:
+        """Loads the data from the local csv file."""
+        self.data_mtime = modification_time(self.local_file_path)
+        self.data = read_cpi_csv(self.local_file_path)
+
+    def save(self) -> None:
+        """Saves the parsed data to a local csv file, replacing it atomically."""
+        atomic_write_csv(self.data, self.local_file_path)
+        self.data_mtime = modification_time(self.local_file_path)
+
+    def update(self) -> bool:
+        """Updates the data by downloading the raw data and reading it into a pandas DataFrame.
+
+        The hashes of the raw payload and of the parsed data are kept next to the local file,
+        with the ``parser_version`` that parsed them. An unchanged payload already parsed by
+        this version skips the parsing, and unchanged data skips the save. The local file is
+        reloaded when another process saved it, see ``reload``.
+
+        Only one process (or thread) per country downloads at a time. The source is not
+        checked again for ``SETTINGS.UPDATE_MIN_INTERVAL`` seconds, the others (waiting for
+        the lock or coming later) reuse the result of the last check instead of fetching again.
+
+        Returns:
+            bool: True if ``data`` was replaced by new data.
+        """
+        with file_lock(self.lock_file_path):
+            hashes = read_json(self.hashes_file_path)
+            reloaded = self.reload()
+            if self.checked_recently(hashes):
+                logger.info(f"The {self.country} source was just checked by another process, reusing it.")
+                return reloaded
+
+            parsed_hash = hashes.get("payload") if hashes.get("parser") == self.parser_version else None
+            # a source must not roll back the data already published
+            not_before = None if self.data is None else pd.to_datetime(self.data[CPIColumns.DATE.value]).max()
+            download = self.fetch(parsed_hash, not_before)
+            if download is None:
+                return reloaded
+
+            changed = download.data is not None
+            if changed:
+                data_hash = hashlib.sha256(
+                    pd.util.hash_pandas_object(download.data, index=False).to_numpy()
+                ).hexdigest()
+                changed = data_hash != hashes.get("data")
+                hashes["data"] = data_hash
+                # the intermediate frames stay local, the attributes only ever hold complete results
+                self.payload, self.data, self.reference_date = (
+                    download.payload,
+                    download.data,
+                    download.reference_date,
+                )
+            hashes["payload"] = download.payload_hash
+            hashes["parser"] = self.parser_version
+
+            if changed:
+                self.save()
+            else:
+                logger.info(f"The {self.country} data did not change, skipping the save.")
+            hashes["checked_at"] = pd.Timestamp.now(tz="UTC").isoformat()
+            atomic_write_json(hashes, self.hashes_file_path)
+        return changed or reloaded
+
+    def reload(self) -> bool:
+        """Loads the local file if it changed since ``data`` was loaded from or saved to it.
+
+        A parser without data loads the file as its starting point, which is not a change.
+        Seed ``data`` and ``data_mtime`` with the published data to compare against it.
+
+        Returns:
+            bool: True if ``data`` was replaced by a different version of the local file.
+        """
+        mtime = modification_time(self.local_file_path)
+        if mtime is None or mtime == self.data_mtime:
+            return False
+        replaced = self.data is not None
+        self.load()
+        return replaced
+
+    @property
+    def parser_version(self) -> str:
+        """Identifies the parsing code and the spec of this parser."""
+        spec = getattr(self, "spec", None)
+        return hashlib.sha256(f"{PARSER_VERSION}:{type(self).__name__}:{spec!r}".encode()).hexdigest()[:16]
+
+    @staticmethod
+    def checked_recently(hashes: dict) -> bool:
+        """Checks whether the source was checked less than ``SETTINGS.UPDATE_MIN_INTERVAL`` seconds ago."""
+        if "checked_at" not in hashes:
+            return False
+        elapsed = pd.Timestamp.now(tz="UTC") - pd.Timestamp(hashes["checked_at"])
+        return elapsed.total_seconds() < SETTINGS.UPDATE_MIN_INTERVAL
+
+    def get_data(self, backend: Optional[str] = None) -> CPIFrame:
+        """Returns the data with the universal schema.
+
+        Args:
+            backend (str, optional): The dataframe library of the result. Defaults to ``SETTINGS.BACKEND``.
+
+        Returns:
+            pd.DataFrame: A pandas DataFrame with the universal schema, or its Arrow/Polars equivalent.
+        """
+        return to_backend(self.data, backend)
@@ -1,8 +1,44 @@
 # -*- coding: utf-8 -*-
-"""This module contains a parser for the Chile CPI data."""
+"""This module contains a parser for the Chilean CPI data."""
 
-from cpilatam.parsers.base import BaseCPIParser
+from cpilatam import SETTINGS
+from cpilatam.names import Countries, DateLayout, SourceFormat
+from cpilatam.parsers.base import BaseCPIParser, ParserSpec, Source
 
 
 class ChileCPIParser(BaseCPIParser):
-    pass
+    spec = ParserSpec(
+        date_layout=DateLayout.YEAR_MONTH_COLUMNS,
+        # the "Año", "Mes", "Índice" header row is the third one
+        rows=(3, None),
+        date_columns=(0, 1),
+        value_column=2,
+        # e.g. "Cobertura Nacional - Año base 2018", the base year is referenced by its January
+        reference_date_cell=(0, 2),
+        reference_date_pattern=r"base (?P<year>\d{4})",
+    )
+
+    def __init__(self):
+        super().__init__(
+            local_file_path=SETTINGS.CHILE_LOCAL_PATH.as_posix(),
+            sources=[
+                Source(
+                    url=(
+                        "https://www.ine.gob.cl/docs/default-source/indice-de-precios-al-consumidor/"
+                        "cuadros-estadisticos/base-2018/series-de-tiempo/ipc-xls.xlsx"
+                    ),
+                    source_format=SourceFormat.EXCEL,
+                )
+            ],
+            country=Countries.CHILE.value,
+        )
+
+
+if __name__ == "__main__":
+    parser = ChileCPIParser()
+    # Download data
+    parser.download()
+
+    # Parse and display the transformed data
+    parser.parse()
+    print(parser.data)
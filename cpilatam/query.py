@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+"""This module contains the CPI lookups, returned in the dataframe library selected in the settings."""
+
+from typing import Dict, List, Optional, Tuple
+
+import pandas as pd
+
+from cpilatam import SETTINGS
+from cpilatam.backends import CPIFrame, to_backend
+from cpilatam.settings import Backend
+from cpilatam.snapshot import get_snapshot, get_snapshots
+
+_PANEL_CACHE: Dict[Tuple, Tuple[Tuple[int, ...], object]] = {}
+
+
+def get_cpi(country: str, backend: Optional[str] = None) -> CPIFrame:
+    """Returns the CPI data of a country.
+
+    Conversions to Arrow and Polars are cached in the snapshot of the country, so they are
+    built once per version of the data.
+
+    Args:
+        country (str): The country, a key of ``DF_CPI``.
+        backend (str, optional): The dataframe library of the result. Defaults to ``SETTINGS.BACKEND``.
+
+    Returns:
+        pd.DataFrame, pa.Table or pl.DataFrame: The data with the universal schema.
+    """
+    backend = Backend(SETTINGS.BACKEND if backend is None else backend)
+    snapshot = get_snapshot(country)
+    return snapshot.cached(("backend", backend), lambda: to_backend(snapshot.data, backend))
+
+
+def get_panel(countries: Optional[List[str]] = None, backend: Optional[str] = None) -> CPIFrame:
+    """Returns the CPI of several countries side by side, one row per date and one column per country.
+
+    Args:
+        countries (list, optional): The countries, keys of ``DF_CPI``. Defaults to all.
+        backend (str, optional): The dataframe library of the result. Defaults to ``SETTINGS.BACKEND``.
+
+    Returns:
+        pd.DataFrame, pa.Table or pl.DataFrame: The panel, with a ``date`` column.
+    """
+    backend = Backend(SETTINGS.BACKEND if backend is None else backend)
+    # a single read of the store gives a consistent set of versions
+    snapshots = get_snapshots()
+    countries = tuple(snapshots.keys() if countries is None else countries)
+    versions = tuple(snapshots[country].version for country in countries)
+
+    key = (countries, backend)
+    cached = _PANEL_CACHE.get(key)
+    if cached is not None and cached[0] == versions:
+        return cached[1]
+
+    panel = pd.concat({country: snapshots[country].index for country in countries}, axis=1)
+    panel = to_backend(panel.sort_index().reset_index(), backend)
+    _PANEL_CACHE[key] = (versions, panel)
+    return panel
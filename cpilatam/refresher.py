@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+"""This module contains a background refresher that keeps the CPI data up to date."""
+
+import threading
+from typing import List, Optional
+
+from cpilatam import RELEASE_DAYS, SETTINGS, logger, update
+from cpilatam.exc import CountryNotSupported
+from cpilatam.release import is_stale
+from cpilatam.snapshot import get_snapshots
+
+
+class AutoRefresher(threading.Thread):
+    """Daemon thread that periodically updates the countries with stale data.
+
+    The network fetch and parsing run in this thread; ``update`` only publishes the new
+    snapshots once they are complete, so readers never wait on it.
+    """
+
+    def __init__(self, interval: Optional[float] = None, countries: Optional[List[str]] = None):
+        """Initializes the refresher.
+
+        Args:
+            interval (float, optional): Seconds between two staleness checks.
+                Defaults to ``SETTINGS.AUTO_REFRESH_INTERVAL``.
+            countries (list, optional): Countries to keep up to date. Defaults to all.
+
+        Raises:
+            CountryNotSupported: If a country has no release day.
+        """
+        for country in countries or []:
+            if country not in RELEASE_DAYS:
+                raise CountryNotSupported(country=country, countries=list(RELEASE_DAYS))
+        super().__init__(name="cpilatam-refresher", daemon=True)
+        self.interval: float = SETTINGS.AUTO_REFRESH_INTERVAL if interval is None else interval
+        self.countries: Optional[List[str]] = countries
+        self._stop_event = threading.Event()
+
+    def stale_countries(self, today=None) -> List[str]:
+        """Returns the countries whose data is missing an already released month."""
+        snapshots = get_snapshots()
+        countries = snapshots.keys() if self.countries is None else self.countries
+        return [
+            country for country in countries if is_stale(snapshots[country].data, RELEASE_DAYS[country], today)
+        ]
+
+    def refresh(self) -> List[str]:
+        """Updates the stale countries.
+
+        Any error is logged, so the thread keeps running and retries on the next check.
+
+        Returns:
+            list: The countries that were found stale.
+        """
+        stale = []
+        try:
+            stale = self.stale_countries()
+            if stale:
+                logger.info(f"Refreshing stale countries: {stale}")
+                update(stale)
+        except Exception:  # pylint: disable=broad-except
+            logger.exception("Background refresh failed, retrying on the next check.")
+        return stale
+
+    def run(self) -> None:
+        while not self._stop_event.is_set():
+            self.refresh()
+            self._stop_event.wait(self.interval)
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Stops the refresher and waits for the current check to finish."""
+        self._stop_event.set()
+        if self.is_alive():
+            self.join(timeout)
+
+
+def start_auto_refresh(interval: Optional[float] = None, countries: Optional[List[str]] = None) -> AutoRefresher:
+    """Starts a background refresher.
+
+    Args:
+        interval (float, optional): Seconds between two staleness checks.
+        countries (list, optional): Countries to keep up to date. Defaults to all.
+
+    Returns:
+        AutoRefresher: The running refresher, call ``stop`` on it to end it.
+    """
+    refresher = AutoRefresher(interval=interval, countries=countries)
+    refresher.start()
+    return refresher
@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+"""This module contains the release calendar helpers used to detect stale CPI data."""
+
+from datetime import date
+from typing import Optional, Union
+
+import pandas as pd
+
+from cpilatam.names import CPIColumns
+
+
+def current_day() -> pd.Timestamp:
+    """Returns the current day, the reference of the release calendar."""
+    return pd.Timestamp.today().normalize()
+
+
+def last_expected_period(release_day: int, today: Optional[Union[str, date]] = None) -> pd.Timestamp:
+    """Returns the latest month whose CPI should already be published.
+
+    Central banks publish the CPI of a month some days after it ends, so the CPI of
+    the previous month is only expected once ``release_day`` has been reached.
+
+    Args:
+        release_day (int): Day of the month on which the previous month CPI is released.
+        today (date, optional): The reference day. Defaults to today.
+
+    Returns:
+        pd.Timestamp: The first day of the latest month expected in the data.
+
+    Example:
+        >>> last_expected_period(8, "2023-11-07")
+        Timestamp('2023-09-01 00:00:00')
+        >>> last_expected_period(8, "2023-11-08")
+        Timestamp('2023-10-01 00:00:00')
+    """
+    today = current_day() if today is None else pd.Timestamp(today)
+    months_back = 1 if today.day >= release_day else 2
+    return today.to_period("M").to_timestamp() - pd.DateOffset(months=months_back)
+
+
+def is_stale(data: pd.DataFrame, release_day: int, today: Optional[Union[str, date]] = None) -> bool:
+    """Checks whether a CPI series is missing a month that should already be published.
+
+    Args:
+        data (pd.DataFrame): A CPI series with the universal schema.
+        release_day (int): Day of the month on which the previous month CPI is released.
+        today (date, optional): The reference day. Defaults to today.
+
+    Returns:
+        bool: True if the last date of the series is older than the last expected period.
+    """
+    last_date = pd.to_datetime(data[CPIColumns.DATE.value]).max()
+    return last_date < last_expected_period(release_day, today)
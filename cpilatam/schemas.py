@@ -26,3 +26,6 @@ CPI_SCHEMA = DataFrameSchema(
     coerce=True,
     strict=True,
 )
+
+# same checks without coercion, for frames already built with the schema dtypes (coercing copies every column)
+TYPED_CPI_SCHEMA = DataFrameSchema(columns=CPI_SCHEMA.columns, coerce=False, strict=True)
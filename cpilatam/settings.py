@@ -68,6 +68,19 @@ class LogFormatter(Enum):
     """pprinted, colored, for humans"""
 
 
+class Backend(Enum):
+    """Define allowed dataframe libraries for query results."""
+
+    PANDAS = "PANDAS"
+    """pandas DataFrames"""
+
+    ARROW = "ARROW"
+    """pyarrow Tables, requires ``pyarrow``"""
+
+    POLARS = "POLARS"
+    """polars DataFrames, requires ``polars`` and ``pyarrow``"""
+
+
 class Settings(BaseSettings):
     """Project settings variables."""
 
@@ -89,12 +102,42 @@ class Settings(BaseSettings):
     LOG_DESTINATION: LogDest = LogDest.CONSOLE.value
     """Destination for logs."""
 
+    BACKEND: Backend = Backend.PANDAS.value
+    """Dataframe library of the query results."""
+
     COLOMBIA_LOCAL_PATH: Path = Path(PACKAGE_PATH, "data", "colombia.csv")
     """Path to local file with Colombia CPI data."""
 
     PERU_LOCAL_PATH: Path = Path(PACKAGE_PATH, "data", "peru.csv")
     """Path to local file with Peru CPI data."""
 
+    CHILE_LOCAL_PATH: Path = Path(PACKAGE_PATH, "data", "chile.csv")
+    """Path to local file with Chile CPI data."""
+
+    COLOMBIA_RELEASE_DAY: int = 8
+    """Day of the month on which DANE publishes the CPI of the previous month."""
+
+    PERU_RELEASE_DAY: int = 1
+    """Day of the month on which BCRP publishes the CPI of the previous month."""
+
+    CHILE_RELEASE_DAY: int = 8
+    """Day of the month on which INE publishes the CPI of the previous month."""
+
+    MIRROR_PATH: Optional[Path] = None
+    """Directory with a mirror of the source payloads (e.g. ``peru.html``), the last source tried."""
+
+    HEDGE_DELAY: float = 2.0
+    """Seconds to wait for a source before also requesting the next one."""
+
+    UPDATE_MIN_INTERVAL: float = 60
+    """Seconds during which a source checked by another process (or thread) is not checked again."""
+
+    AUTO_REFRESH: bool = False
+    """Start the background refresher when the package is imported."""
+
+    AUTO_REFRESH_INTERVAL: float = 3600
+    """Seconds between two staleness checks of the background refresher."""
+
     class Config:
         """Inner configuration."""
 
@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+"""This module contains the versioned snapshots of the CPI data read by concurrent readers."""
+
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Hashable
+
+import numpy as np
+import pandas as pd
+
+from cpilatam.names import CPIColumns
+
+
+@dataclass(frozen=True)
+class CPISnapshot:
+    """Immutable version of the CPI data of a country and everything derived from it.
+
+    A snapshot is never modified once published, an update publishes a new one. Readers
+    keep the snapshot they got for as long as they need a consistent view, without locks.
+    The frames must be treated as read-only.
+
+    Attributes:
+        country (str): The country of the CPI data.
+        version (int): Increases by one with every publication for the country.
+        data (pd.DataFrame): The data with the universal schema.
+        index (pd.Series): The CPI values indexed by date, for lookups.
+        caches (dict): Values derived from ``data``, filled on demand by ``cached``.
+    """
+
+    country: str
+    version: int
+    data: pd.DataFrame
+    index: pd.Series
+    caches: Dict[Hashable, Any] = field(default_factory=dict, compare=False, repr=False)
+
+    def cached(self, key: Hashable, build: Callable[[], Any]) -> Any:
+        """Returns the value derived from this snapshot under ``key``, building it the first time."""
+        try:
+            return self.caches[key]
+        except KeyError:
+            return self.caches.setdefault(key, build())
+
+    def cpi_at(self, dates) -> np.ndarray:
+        """Returns the CPI of the month of each date, NaN for months without data."""
+        months = pd.DatetimeIndex(pd.to_datetime(dates)).to_period("M").to_timestamp()
+        return self.index.reindex(months).to_numpy()
+
+
+_SNAPSHOTS: Dict[str, CPISnapshot] = {}
+_PUBLISH_LOCK = threading.Lock()
+
+
+def publish(country: str, data: pd.DataFrame) -> CPISnapshot:
+    """Publishes new data for a country as the next version of its snapshot.
+
+    The snapshot is fully built before the store is replaced by a new dict in a single
+    assignment, so readers see either the previous versions or the new one.
+
+    Args:
+        country (str): The country of the CPI data.
+        data (pd.DataFrame): The data with the universal schema, not to be modified afterwards.
+
+    Returns:
+        CPISnapshot: The published snapshot.
+    """
+    global _SNAPSHOTS  # pylint: disable=global-statement
+
+    index = pd.Series(
+        data[CPIColumns.CPI.value].to_numpy(),
+        index=pd.DatetimeIndex(pd.to_datetime(data[CPIColumns.DATE.value]), name=CPIColumns.DATE.value),
+        name=CPIColumns.CPI.value,
+    )
+    with _PUBLISH_LOCK:
+        previous = _SNAPSHOTS.get(country)
+        snapshot = CPISnapshot(
+            country=country,
+            version=0 if previous is None else previous.version + 1,
+            data=data,
+            index=index,
+        )
+        _SNAPSHOTS = {**_SNAPSHOTS, country: snapshot}
+    return snapshot
+
+
+def get_snapshot(country: str) -> CPISnapshot:
+    """Returns the current snapshot of a country."""
+    return _SNAPSHOTS[country]
+
+
+def get_snapshots() -> Dict[str, CPISnapshot]:
+    """Returns the current snapshots of every country, a consistent view that is never modified."""
+    return _SNAPSHOTS
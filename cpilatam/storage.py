@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+"""This module contains the file helpers used to share the local CPI files between processes."""
+
+import json
+import os
+import shutil
+import tempfile
+from contextlib import contextmanager
+from typing import Callable, Generator, Optional, TextIO
+
+import pandas as pd
+
+from cpilatam.names import CPIColumns
+
+try:
+    import fcntl
+
+    FCNTL_INSTALLED = True
+
+except ImportError:  # pragma: no cover
+    import msvcrt
+
+    FCNTL_INSTALLED = False
+
+
+@contextmanager
+def file_lock(lock_file_path: str) -> Generator[None, None, None]:
+    """Holds an exclusive inter-process lock on ``lock_file_path`` while in the context.
+
+    The call blocks until the lock is available. Every ``open`` gets its own lock, so it
+    also serializes threads of the same process.
+
+    Args:
+        lock_file_path (str): Path to the lock file, created if it does not exist.
+    """
+    with open(lock_file_path, "a+b") as lock_file:
+        if FCNTL_INSTALLED:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+        else:  # pragma: no cover
+            lock_file.seek(0)
+            msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            if FCNTL_INSTALLED:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+            else:  # pragma: no cover
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+def read_cpi_csv(path: str) -> pd.DataFrame:
+    """Reads a local CPI csv file with its date columns parsed as datetimes."""
+    return pd.read_csv(path, parse_dates=[CPIColumns.DATE.value, CPIColumns.REFERENCE_DATE.value])
+
+
+def modification_time(path: str) -> Optional[int]:
+    """Returns the modification time of ``path`` in nanoseconds, or None if it does not exist."""
+    try:
+        return os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+
+def atomic_write(path: str, write: Callable[[TextIO], None]) -> None:
+    """Writes a text file without exposing a partially written file.
+
+    ``write`` fills a temporary file in the same directory that is then renamed over
+    ``path``, so readers either see the previous file or the new one.
+
+    Args:
+        path (str): The destination path.
+        write (callable): Writes the content into the open temporary file.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    file_descriptor, tmp_path = tempfile.mkstemp(dir=directory, prefix=".", suffix=".tmp")
+    try:
+        with os.fdopen(file_descriptor, "w", newline="") as tmp_file:
+            write(tmp_file)
+            tmp_file.flush()
+            os.fsync(tmp_file.fileno())
+        # mkstemp creates the file readable only by its owner
+        if os.path.exists(path):
+            shutil.copymode(path, tmp_path)
+        else:
+            os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+
+def atomic_write_csv(data: pd.DataFrame, path: str) -> None:
+    """Writes ``data`` to ``path`` in csv format, see :func:`atomic_write`."""
+    atomic_write(path, lambda file: data.to_csv(file, index=False))
+
+
+def atomic_write_json(content: dict, path: str) -> None:
+    """Writes ``content`` to ``path`` in json format, see :func:`atomic_write`."""
+    atomic_write(path, lambda file: json.dump(content, file, indent=4))
+
+
+def read_json(path: str) -> dict:
+    """Reads a json file, an empty dict if it does not exist."""
+    try:
+        with open(path) as file:
+            return json.load(file)
+    except FileNotFoundError:
+        return {}
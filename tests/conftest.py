@@ -0,0 +1,10 @@
+import pytest
+
+from cpilatam import snapshot as snapshot_module
+from cpilatam.snapshot import get_snapshots
+
+
+@pytest.fixture
+def restore_snapshots(monkeypatch):
+    # every publication replaces the store, so restoring the reference restores the snapshots
+    monkeypatch.setattr(snapshot_module, "_SNAPSHOTS", get_snapshots())
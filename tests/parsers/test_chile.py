@@ -0,0 +1,32 @@
+import pandas as pd
+import pytest
+
+from cpilatam.parsers.chile import ChileCPIParser
+from cpilatam.schemas import CPI_SCHEMA
+
+
+class TestChileParser:
+    @pytest.fixture
+    def setUp(self, monkeypatch):
+        # crear instancia
+        self.parser = ChileCPIParser()
+
+        # mock download using monkeypatch
+        monkeypatch.setattr(self.parser, "download", self.mock_download)
+
+    def mock_download(self):
+        # Read the data and assign it to self.data
+        self.parser.data = pd.read_excel("tests/data/chile.xlsx")
+
+    def test_parse(self, setUp):
+        # read data
+        self.parser.download()
+
+        # proceed to parse the data
+        self.parser.parse()
+
+        # assert that the schema is correct
+        CPI_SCHEMA.validate(self.parser.data)
+        assert self.parser.reference_date == pd.Timestamp("2018-01-01")
+        assert self.parser.data["date"].iloc[0] == pd.Timestamp("2009-12-01")
+        assert self.parser.data["cpi"].iloc[-1] == 133.82
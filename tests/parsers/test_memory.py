@@ -0,0 +1,65 @@
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from cpilatam.exc import CPIValuesNotFound
+from cpilatam.parsers.colombia import ColombiaCPIParser
+from cpilatam.parsers.peru import PeruCPIParser
+from tests.replay import synthetic_bcrp_html, synthetic_dane_xlsx
+
+
+def parse_peak(parser, payload):
+    """Parses ``payload`` and returns the peak of the memory allocated while parsing and the raw size."""
+    raw = parser.read(payload)
+    raw_size = raw.memory_usage(deep=True).sum()
+    parser.data = raw
+    tracemalloc.start()
+    try:
+        parser.parse()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return peak, raw_size
+
+
+@pytest.mark.parametrize(
+    "parser_class, generator, years, max_ratio",
+    [
+        # the raw BCRP table holds one label and one value per month as python objects
+        (PeruCPIParser, synthetic_bcrp_html, 330, 2.5),
+        # the raw DANE table holds one float per month, the parsed data three columns per month
+        (ColombiaCPIParser, synthetic_dane_xlsx, 210, 8),
+    ],
+)
+def test_parse_peak_memory(parser_class, generator, years, max_ratio):
+    parser = parser_class()
+    # the allocations that do not depend on the size of the data (e.g. the schema validation)
+    fixed_peak, _ = parse_peak(parser, generator(1))
+
+    peak, raw_size = parse_peak(parser, generator(years))
+
+    assert len(parser.data) == years * 12
+    assert peak - fixed_peak <= max_ratio * raw_size
+
+
+def peru_raw(labels, values):
+    title = "Índice de precios Lima Metropolitana (índice Dic.2021 = 100)"
+    return pd.DataFrame({"Fecha": labels, title: np.asarray(values, dtype=float)})
+
+
+def test_parse_leaves_raw_table_unchanged():
+    raw = peru_raw(["Ene23", "Feb23", "Mar23"], [1.0, np.nan, 3.0])
+    parser = PeruCPIParser()
+
+    data, _ = parser.parse_raw(raw)
+
+    assert data["cpi"].tolist() == [1.0, 1.0, 3.0]
+    assert np.isnan(raw.iat[1, 1])
+    assert not np.shares_memory(data["cpi"].to_numpy(), raw.iloc[:, 1].to_numpy())
+
+
+def test_parse_empty_table():
+    with pytest.raises(CPIValuesNotFound):
+        PeruCPIParser().parse_raw(peru_raw([], []))
@@ -0,0 +1,69 @@
+import pytest
+
+from cpilatam.names import SourceFormat
+from cpilatam.parsers.base import Source
+from cpilatam.parsers.chile import ChileCPIParser
+from cpilatam.parsers.colombia import ColombiaCPIParser
+from cpilatam.parsers.peru import PeruCPIParser
+from cpilatam.schemas import CPI_SCHEMA
+from tests.replay import (
+    CONTENT_TYPES,
+    load_payload,
+    measure,
+    replay_server,
+    synthetic_bcrp_html,
+    synthetic_dane_xlsx,
+)
+
+
+@pytest.mark.parametrize("parser_class", [ColombiaCPIParser, ChileCPIParser])
+def test_replay_recorded_payload(parser_class):
+    parser = parser_class()
+    with replay_server({"/" + parser.country: load_payload(parser.country)}) as base_url:
+        parser.sources = [Source(url=f"{base_url}/{parser.country}", source_format=SourceFormat.EXCEL)]
+        parser.download()
+    parser.parse()
+
+    CPI_SCHEMA.validate(parser.data)
+    assert parser.data["date"].max().strftime("%Y-%m") == "2023-10"
+
+
+@pytest.mark.parametrize("scale", [1, 10])
+def test_replay_synthetic_bcrp(scale):
+    years = 33 * scale
+    parser = PeruCPIParser()
+    with replay_server({"/peru": (synthetic_bcrp_html(years), CONTENT_TYPES[".html"])}) as base_url:
+        parser.sources = [Source(url=base_url + "/peru", source_format=SourceFormat.HTML_TABLE)]
+        stats = measure(parser)
+
+    CPI_SCHEMA.validate(parser.data)
+    assert stats["rows"] == years * 12
+    assert parser.data["date"].min().year == 2023 - years + 1
+
+
+@pytest.mark.parametrize("scale", [1, 10])
+def test_replay_synthetic_dane(scale):
+    years = 21 * scale
+    parser = ColombiaCPIParser()
+    with replay_server({"/colombia": (synthetic_dane_xlsx(years), CONTENT_TYPES[".xlsx"])}) as base_url:
+        parser.sources = [Source(url=base_url + "/colombia", source_format=SourceFormat.EXCEL)]
+        stats = measure(parser)
+
+    CPI_SCHEMA.validate(parser.data)
+    assert stats["rows"] == years * 12
+    assert parser.reference_date.strftime("%Y-%m") == "2018-12"
+
+
+def test_download_parses_once(monkeypatch):
+    parser = PeruCPIParser()
+    calls = []
+    parse_raw = parser.parse_raw
+    monkeypatch.setattr(parser, "parse_raw", lambda raw: calls.append(raw) or parse_raw(raw))
+    with replay_server({"/peru": (synthetic_bcrp_html(3), CONTENT_TYPES[".html"])}) as base_url:
+        parser.sources = [Source(url=base_url + "/peru", source_format=SourceFormat.HTML_TABLE)]
+        parser.download()
+    parser.parse()
+
+    assert len(calls) == 1
+    assert len(parser.data) == 36
+    assert parser.reference_date.strftime("%Y-%m") == "2021-12"
@@ -0,0 +1,152 @@
+import time
+
+import pandas as pd
+import pytest
+
+from cpilatam import SETTINGS, release
+from cpilatam.exc import UnsupportedSpec
+from cpilatam.names import SourceFormat
+from cpilatam.parsers.base import Source
+from cpilatam.parsers.colombia import ColombiaCPIParser
+from cpilatam.parsers.peru import PeruCPIParser
+from tests.replay import (
+    CONTENT_TYPES,
+    replay_server,
+    synthetic_bcrp_html,
+    synthetic_bcrp_json,
+    synthetic_dane_xlsx,
+)
+
+HTML = (synthetic_bcrp_html(3), CONTENT_TYPES[".html"])
+JSON = (synthetic_bcrp_json(3), CONTENT_TYPES[".json"])
+XLSX = synthetic_dane_xlsx(3)
+OLDER_XLSX = synthetic_dane_xlsx(3, end_year=2022)
+
+
+@pytest.fixture
+def parser(monkeypatch):
+    monkeypatch.setattr(SETTINGS, "HEDGE_DELAY", 0.1)
+    return PeruCPIParser()
+
+
+def peru_sources(base_url):
+    return [
+        Source(url=base_url + "/html", source_format=SourceFormat.HTML_TABLE),
+        Source(url=base_url + "/json", source_format=SourceFormat.JSON),
+    ]
+
+
+def dane_sources(base_url, *releases):
+    return [
+        Source(url=f"{base_url}/{release}", source_format=SourceFormat.EXCEL, release=release)
+        for release in releases
+    ]
+
+
+def test_fetch_hedges_slow_source(parser):
+    with replay_server({"/html": HTML, "/json": JSON}, delays={"/html": 2}) as base_url:
+        parser.sources = peru_sources(base_url)
+        start = time.perf_counter()
+        download = parser.fetch()
+        elapsed = time.perf_counter() - start
+
+    assert download.payload == JSON[0]
+    assert len(download.data) == 36
+    assert parser.source == parser.sources[1]
+    assert elapsed < 1
+
+
+def test_fetch_prefers_first_source(parser):
+    with replay_server({"/html": HTML, "/json": JSON}) as base_url:
+        parser.sources = peru_sources(base_url)
+        assert parser.fetch().payload == HTML[0]
+    assert parser.source == parser.sources[0]
+
+
+def test_fetch_falls_back_on_failure(parser):
+    with replay_server({"/json": JSON}) as base_url:
+        parser.sources = peru_sources(base_url)
+        assert parser.fetch().payload == JSON[0]
+
+        parser.sources = parser.sources[:1]
+        assert parser.fetch() is None
+
+
+def test_fetch_skips_invalid_payload(monkeypatch):
+    monkeypatch.setattr(SETTINGS, "HEDGE_DELAY", 0.1)
+    parser = ColombiaCPIParser()
+    # a "soft 404": an error page served with a 200 status
+    error_page = (b"<html><body>Page not found</body></html>", CONTENT_TYPES[".html"])
+    with replay_server({"/nov23": error_page, "/oct23": (XLSX, CONTENT_TYPES[".xlsx"])}) as base_url:
+        parser.sources = dane_sources(base_url, "nov23", "oct23")
+        download = parser.fetch()
+
+    assert download.source.release == "oct23"
+    assert len(download.data) == 36
+
+
+def test_fetch_tries_releases_in_order(monkeypatch):
+    monkeypatch.setattr(SETTINGS, "HEDGE_DELAY", 0.1)
+    parser = ColombiaCPIParser()
+    payloads = {"/nov23": (XLSX, CONTENT_TYPES[".xlsx"]), "/oct23": (OLDER_XLSX, CONTENT_TYPES[".xlsx"])}
+    with replay_server(payloads, delays={"/nov23": 0.5}) as base_url:
+        parser.sources = dane_sources(base_url, "nov23", "oct23")
+        download = parser.fetch()
+
+        # the newer release is slower than the hedge delay, but an older one is never raced against it
+        assert download.source.release == "nov23"
+        assert download.data["date"].max().year == 2023
+
+        # data older than the one already published is rejected
+        parser.sources = dane_sources(base_url, "oct23")
+        assert parser.fetch(not_before=pd.Timestamp("2023-01-01")) is None
+
+
+def test_read_api_json_matches_html(parser):
+    from_html, _ = parser.parse_raw(parser.read(HTML[0], SourceFormat.HTML_TABLE))
+    from_json, _ = parser.parse_raw(parser.read(JSON[0], SourceFormat.JSON))
+
+    pd.testing.assert_frame_equal(from_json, from_html)
+
+
+def test_json_requires_read_override():
+    with pytest.raises(UnsupportedSpec):
+        ColombiaCPIParser().read(JSON[0], SourceFormat.JSON)
+
+
+def test_mirror_source(tmp_path, monkeypatch):
+    (tmp_path / "peru.html").write_bytes(HTML[0])
+    monkeypatch.setattr(SETTINGS, "MIRROR_PATH", tmp_path)
+    parser = PeruCPIParser()
+    mirror = parser.sources[-1]
+
+    assert mirror.source_format == SourceFormat.HTML_TABLE
+    assert mirror.release == "mirror"
+    assert parser.fetch_source(mirror) == HTML[0]
+
+    parser.sources = [mirror]
+    parser.download()
+    parser.parse()
+    assert len(parser.data) == 36
+
+
+@pytest.mark.parametrize("parser_class", [PeruCPIParser, ColombiaCPIParser])
+def test_sources_follow_the_current_day(parser_class, monkeypatch):
+    monkeypatch.setattr(release, "current_day", lambda: pd.Timestamp("2023-11-08"))
+    parser = parser_class()
+    monkeypatch.setattr(release, "current_day", lambda: pd.Timestamp("2024-03-10"))
+    requested = []
+    monkeypatch.setattr(parser, "fetch_source", lambda source: requested.append(source.url))
+
+    assert parser.fetch() is None
+
+    # the BCRP series ends in the current month, the newest DANE candidate is March 2024
+    expected = "/2024-3" if parser_class is PeruCPIParser else "/mar24/"
+    assert expected in requested[0]
+
+
+def test_colombia_candidate_sources():
+    sources = ColombiaCPIParser.candidate_sources("2024-01-10")
+
+    assert [source.release for source in sources] == ["ene24", "dic23", "nov23", "oct23"]
+    assert sources[0].url.endswith("/ene24/IPC_Indices.xlsx")
@@ -0,0 +1,252 @@
+"""Record/replay harness for the raw source payloads.
+
+Raw responses of the sources are kept in a versioned fixture store (``tests/data/payloads``)
+and served back by a local HTTP server, so ``download`` runs its real HTML/xlsx handling
+offline. The generators build payloads with the same structure as the real ones and as
+many years as requested, to measure parsing at scale deterministically.
+
+Record a new version of the store (requires internet access)::
+
+    python -m tests.replay record v2
+"""
+
+import hashlib
+import io
+import json
+import sys
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, Generator, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from cpilatam.parsers.base import MIRROR_EXTENSIONS
+
+STORE_PATH = Path(__file__).parent / "data" / "payloads"
+
+CONTENT_TYPES = {
+    ".html": "text/html; charset=utf-8",
+    ".json": "application/json",
+    ".xlsx": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+}
+
+SPANISH_MONTHS = ["Ene", "Feb", "Mar", "Abr", "May", "Jun", "Jul", "Ago", "Sep", "Oct", "Nov", "Dic"]
+SPANISH_MONTH_NAMES = [
+    "Enero",
+    "Febrero",
+    "Marzo",
+    "Abril",
+    "Mayo",
+    "Junio",
+    "Julio",
+    "Agosto",
+    "Septiembre",
+    "Octubre",
+    "Noviembre",
+    "Diciembre",
+]
+
+# datetime64[ns] can't hold dates before 1677-09-21
+MIN_YEAR = 1678
+
+
+def load_manifest(version: str = "v1") -> dict:
+    """Returns the manifest of a version of the store."""
+    return json.loads((STORE_PATH / version / "manifest.json").read_text())
+
+
+def load_payload(country: str, version: str = "v1") -> Tuple[bytes, str]:
+    """Returns the recorded payload of a country and its content type."""
+    entry = load_manifest(version)[country]
+    path = STORE_PATH / version / entry["file"]
+    # a version owns its payloads, files shared with other fixtures could change under it
+    assert path.resolve().parent == (STORE_PATH / version).resolve(), f"{path} is outside of {version}"
+    payload = path.read_bytes()
+    assert hashlib.sha256(payload).hexdigest() == entry["sha256"], f"{country} payload of {version} changed"
+    return payload, entry["content_type"]
+
+
+def record(version: str) -> dict:
+    """Downloads the raw payload of every source into a new version of the store."""
+    from cpilatam.parsers import __parsers__
+
+    directory = STORE_PATH / version
+    directory.mkdir(parents=True, exist_ok=False)
+    manifest = {}
+    for parser in __parsers__:
+        # the store doubles as a mirror directory (``CPILATAM_MIRROR_PATH``), in the format of the first source
+        source_format = parser.sources[0].source_format
+        for source in parser.sources:
+            download = parser.download_source(source) if source.source_format == source_format else None
+            if download is not None:
+                break
+        else:
+            raise RuntimeError(f"No valid {parser.country} payload to record")
+        extension = MIRROR_EXTENSIONS[source_format]
+        file_name = parser.country + extension
+        (directory / file_name).write_bytes(download.payload)
+        manifest[parser.country] = {
+            "file": file_name,
+            "url": source.url,
+            "content_type": CONTENT_TYPES[extension],
+            "sha256": download.payload_hash,
+            "recorded_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        }
+    (directory / "manifest.json").write_text(json.dumps(manifest, indent=4) + "\n")
+    return manifest
+
+
+class _ReplayHandler(BaseHTTPRequestHandler):
+    payloads: Dict[str, Tuple[bytes, str]] = {}
+    delays: Dict[str, float] = {}
+
+    def do_GET(self):  # noqa: N802
+        time.sleep(self.delays.get(self.path, 0))
+        if self.path not in self.payloads:
+            self.send_error(404)
+            return
+        payload, content_type = self.payloads[self.path]
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args):
+        pass
+
+
+@contextmanager
+def replay_server(
+    payloads: Dict[str, Tuple[bytes, str]], delays: Optional[Dict[str, float]] = None
+) -> Generator[str, None, None]:
+    """Serves ``{path: (payload, content type)}`` on localhost while in the context.
+
+    Args:
+        payloads (dict): The payload and content type of each path.
+        delays (dict, optional): Seconds to wait before answering each path, to simulate slow sources.
+
+    Yields:
+        str: The base url of the server, e.g. ``http://127.0.0.1:8123``.
+    """
+    handler = type("ReplayHandler", (_ReplayHandler,), {"payloads": payloads, "delays": delays or {}})
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def synthetic_cpi(years: int, end_year: int = 2023, seed: int = 0) -> pd.Series:
+    """Builds a deterministic monthly CPI series of ``years`` whole years ending in ``end_year``."""
+    start_year = end_year - years + 1
+    if start_year < MIN_YEAR:
+        raise ValueError(f"Can't generate more than {end_year - MIN_YEAR + 1} years ending in {end_year}")
+    growth = np.random.default_rng(seed).normal(0.004, 0.003, years * 12)
+    dates = pd.date_range(f"{start_year}-01-01", periods=years * 12, freq="MS")
+    return pd.Series(100 * np.exp(np.cumsum(growth) - growth.sum() / 2), index=dates).round(6)
+
+
+def synthetic_bcrp_html(years: int, end_year: int = 2023, seed: int = 0) -> bytes:
+    """Builds a BCRP results page with ``years`` years of the Lima CPI series."""
+    cpi = synthetic_cpi(years, end_year, seed)
+    # BCRP labels months like "Ene91", the four digit form is kept for years outside of the %y window
+    if cpi.index[0].year >= 1969 and cpi.index[-1].year <= 2068:
+        labels = [f"{SPANISH_MONTHS[date.month - 1]}{date.year % 100:02d}" for date in cpi.index]
+    else:
+        labels = [f"{SPANISH_MONTHS[date.month - 1]}.{date.year}" for date in cpi.index]
+    rows = "".join(f"<tr><td>{label}</td><td>{value}</td></tr>" for label, value in zip(labels, cpi.values))
+    title = (
+        "Índice de precios Lima Metropolitana (índice Dic.2021 = 100)" " - Índice de Precios al Consumidor (IPC)"
+    )
+    page = (
+        "<html><body><form id='frmMensual'><div class='barra-resultados'><table>"
+        f"<tr><th>Fecha</th><th>{title}</th></tr>{rows}"
+        "</table></div></form></body></html>"
+    )
+    return page.encode("utf-8")
+
+
+def synthetic_bcrp_json(years: int, end_year: int = 2023, seed: int = 0) -> bytes:
+    """Builds a BCRP API JSON response with ``years`` years of the Lima CPI series."""
+    cpi = synthetic_cpi(years, end_year, seed)
+    document = {
+        "config": {
+            "title": "Índice de precios Lima Metropolitana (índice Dic.2021 = 100)",
+            "series": [
+                {
+                    "name": "Índice de precios Lima Metropolitana (índice Dic.2021 = 100)"
+                    " - Índice de Precios al Consumidor (IPC)",
+                    "dec": "6",
+                }
+            ],
+        },
+        "periods": [
+            {"name": f"{SPANISH_MONTHS[date.month - 1]}.{date.year}", "values": [str(value)]}
+            for date, value in cpi.items()
+        ],
+    }
+    return json.dumps(document).encode("utf-8")
+
+
+def synthetic_dane_xlsx(years: int, end_year: int = 2023, seed: int = 0) -> bytes:
+    """Builds a DANE "IPC_Indices" workbook with ``years`` year columns."""
+    cpi = synthetic_cpi(years, end_year, seed)
+    width = years + 1
+    grid = [[None] * width for _ in range(9)]
+    grid[2][0] = "Total, Indice de Precios al Consumidor (IPC)"
+    grid[4][0] = f"Índices - Serie de empalme\n{end_year - years + 1} - {end_year}"
+    grid[7][-1] = "Base Diciembre de 2018 = 100,00"
+    grid[8] = ["Mes"] + list(range(end_year - years + 1, end_year + 1))
+    values = cpi.to_numpy().reshape(years, 12).T
+    for month in range(12):
+        grid.append([SPANISH_MONTH_NAMES[month]] + list(values[month]))
+    grid += [[None] * width, [None] * width, ["Fuente: DANE."] + [None] * years]
+    buffer = io.BytesIO()
+    pd.DataFrame(grid).to_excel(buffer, header=False, index=False)
+    return buffer.getvalue()
+
+
+def measure(parser) -> dict:
+    """Returns the elapsed seconds of each step and the parsing peak memory for the first source of ``parser``.
+
+    The fetch, read and parse run one by one, ``download`` would also parse to validate the payload.
+    """
+    source = parser.sources[0]
+    tracemalloc.start()
+    try:
+        start = time.perf_counter()
+        payload = parser.fetch_source(source)
+        downloaded = time.perf_counter()
+        raw = parser.read(payload, source.source_format)
+        read = time.perf_counter()
+        tracemalloc.reset_peak()
+        raw_size = tracemalloc.get_traced_memory()[0]
+        data, reference_date = parser.parse_raw(raw)
+        parsed = time.perf_counter()
+        peak = tracemalloc.get_traced_memory()[1] - raw_size
+    finally:
+        tracemalloc.stop()
+    parser.payload, parser.data, parser.reference_date = payload, data, reference_date
+    return {
+        "rows": len(data),
+        "download_seconds": downloaded - start,
+        "read_seconds": read - downloaded,
+        "parse_seconds": parsed - read,
+        "parse_peak_bytes": peak,
+    }
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 3 or sys.argv[1] != "record":
+        sys.exit("usage: python -m tests.replay record <version>")
+    print(json.dumps(record(sys.argv[2]), indent=4))
@@ -0,0 +1,59 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from cpilatam.query import get_cpi, get_panel
+from cpilatam.snapshot import get_snapshot, publish
+
+
+def test_pandas_is_default():
+    from cpilatam import DF_CPI
+
+    assert get_cpi("peru") is DF_CPI["peru"]
+    panel = get_panel(["peru", "colombia"])
+    assert list(panel.columns) == ["date", "peru", "colombia"]
+    assert panel["date"].is_monotonic_increasing
+
+
+def test_arrow_is_zero_copy():
+    pytest.importorskip("pyarrow")
+    from cpilatam import DF_CPI
+
+    table = get_cpi("peru", backend="ARROW")
+
+    assert table.num_rows == len(DF_CPI["peru"])
+    assert np.shares_memory(table.column("cpi").chunk(0).to_numpy(), DF_CPI["peru"]["cpi"].to_numpy())
+    # converted once, until the data is updated
+    assert get_cpi("peru", backend="ARROW") is table
+
+
+def test_polars_panel():
+    pytest.importorskip("polars")
+    pytest.importorskip("pyarrow")
+
+    panel = get_panel(backend="POLARS")
+
+    assert panel.columns[0] == "date"
+    assert panel.height == len(get_panel())
+
+
+def test_conversion_cache_invalidated(restore_snapshots):
+    pytest.importorskip("pyarrow")
+
+    original = get_snapshot("chile").data
+    table = get_cpi("chile", backend="ARROW")
+    publish("chile", original.iloc[:-1].copy())
+    assert get_cpi("chile", backend="ARROW").num_rows == table.num_rows - 1
+    assert get_panel(["chile"], backend="ARROW").num_rows == table.num_rows - 1
+
+
+def test_unknown_backend():
+    with pytest.raises(ValueError):
+        get_cpi("peru", backend="SPARK")
+
+
+def test_dates_are_parsed():
+    from cpilatam import DF_CPI
+
+    for df in DF_CPI.values():
+        assert pd.api.types.is_datetime64_any_dtype(df["date"])
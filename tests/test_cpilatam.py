@@ -19,3 +19,23 @@ def test_update():
     from cpilatam import update
 
     update()
+
+
+def test_update_starts_from_published_data(monkeypatch, restore_snapshots):
+    import cpilatam
+    from cpilatam import parsers
+    from cpilatam.parsers.base import BaseCPIParser
+    from cpilatam.snapshot import get_snapshot
+
+    class SeededParser(BaseCPIParser):
+        def update(self):
+            # the data and its mtime are the ones published at import
+            return self.data is not cpilatam.DF_CPI["peru"] or self.data_mtime != cpilatam.DATA_MTIMES["peru"]
+
+    parser = SeededParser(local_file_path=cpilatam.LOCAL_PATHS["peru"], sources=[], country="peru")
+    monkeypatch.setattr(parsers, "__parsers__", [parser])
+    version = get_snapshot("peru").version
+
+    cpilatam.update(["peru"])
+
+    assert get_snapshot("peru").version == version
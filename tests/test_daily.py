@@ -0,0 +1,60 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from cpilatam.daily import DailyIndex, get_daily_index
+from cpilatam.names import InterpolationRule
+from cpilatam.snapshot import publish
+
+MONTHLY = pd.DataFrame(
+    {
+        "date": ["2023-01-01", "2023-02-01", "2023-03-01"],
+        "cpi": [100.0, 110.0, 121.0],
+        "reference_date": ["2018-12-01"] * 3,
+    }
+)
+
+
+def test_step():
+    index = DailyIndex(MONTHLY, rule=InterpolationRule.STEP)
+
+    assert index.start == np.datetime64("2023-01-01")
+    assert index.end == np.datetime64("2023-03-31")
+    np.testing.assert_allclose(index.values_at(["2023-01-31", "2023-02-15", "2023-03-31"]), [100, 110, 121])
+
+
+def test_geometric():
+    index = DailyIndex(MONTHLY, rule=InterpolationRule.GEOMETRIC)
+
+    assert index.end == np.datetime64("2023-03-01")
+    # february has 28 days, so the 15th is half way between the two CPIs
+    np.testing.assert_allclose(
+        index.values_at(["2023-02-01", "2023-02-15", "2023-03-01"]), [110, 110 * 1.1**0.5, 121]
+    )
+    np.testing.assert_allclose(index.values_at(["2023-01-02"]), [100 * 1.1 ** (1 / 31)])
+
+
+def test_lagged():
+    index = DailyIndex(MONTHLY, rule=InterpolationRule.LAGGED, lag=1)
+
+    assert index.start == np.datetime64("2023-02-01")
+    np.testing.assert_allclose(index.values_at(["2023-03-01"]), [110])
+
+
+def test_indexate_out_of_range():
+    index = DailyIndex(MONTHLY, rule=InterpolationRule.STEP)
+
+    result = index.indexate([10.0, 10.0, 10.0], ["2023-01-10", "2022-12-31", None], ["2023-03-10"] * 3)
+
+    assert result[0] == pytest.approx(12.1)
+    assert np.isnan(result[1:]).all()
+
+
+def test_daily_index_cache(restore_snapshots):
+    publish("peru", MONTHLY)
+    index = get_daily_index("peru", InterpolationRule.STEP)
+    assert get_daily_index("peru", InterpolationRule.STEP) is index
+
+    # a new version of the monthly data comes with its own daily index
+    publish("peru", MONTHLY.copy())
+    assert get_daily_index("peru", InterpolationRule.STEP) is not index
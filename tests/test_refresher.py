@@ -0,0 +1,69 @@
+import time
+
+import pandas as pd
+import pytest
+
+from cpilatam.exc import CountryNotSupported
+from cpilatam.release import is_stale, last_expected_period
+
+
+@pytest.mark.parametrize(
+    "today, expected",
+    [
+        ("2023-11-07", "2023-09-01"),
+        ("2023-11-08", "2023-10-01"),
+        ("2024-01-20", "2023-12-01"),
+    ],
+)
+def test_last_expected_period(today, expected):
+    assert last_expected_period(8, today) == pd.Timestamp(expected)
+
+
+def test_is_stale():
+    data = pd.DataFrame({"date": ["2023-08-01", "2023-09-01"], "cpi": [1.0, 1.1]})
+
+    assert not is_stale(data, 8, "2023-11-07")
+    assert is_stale(data, 8, "2023-11-08")
+
+
+def test_refresh_updates_only_stale_countries(monkeypatch):
+    from cpilatam import refresher
+
+    calls = []
+    monkeypatch.setattr(refresher, "update", calls.append)
+    monkeypatch.setattr(refresher, "is_stale", lambda data, release_day, today=None: release_day == 1)
+    monkeypatch.setitem(refresher.RELEASE_DAYS, "peru", 1)
+    monkeypatch.setitem(refresher.RELEASE_DAYS, "colombia", 8)
+
+    assert refresher.AutoRefresher().refresh() == ["peru"]
+    assert calls == [["peru"]]
+
+
+def test_refresh_survives_errors(monkeypatch):
+    from cpilatam import refresher
+
+    def broken_check(self, today=None):
+        raise KeyError("chile")
+
+    monkeypatch.setattr(refresher.AutoRefresher, "stale_countries", broken_check)
+    auto_refresher = refresher.start_auto_refresh(interval=0.01)
+    time.sleep(0.1)
+
+    assert auto_refresher.is_alive()
+    auto_refresher.stop(timeout=5)
+
+
+def test_refresher_unknown_country():
+    from cpilatam.refresher import AutoRefresher
+
+    with pytest.raises(CountryNotSupported):
+        AutoRefresher(countries=["atlantis"])
+
+
+def test_refresher_stops():
+    from cpilatam.refresher import start_auto_refresh
+
+    auto_refresher = start_auto_refresh(interval=3600, countries=[])
+    auto_refresher.stop(timeout=5)
+
+    assert not auto_refresher.is_alive()
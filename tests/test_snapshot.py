@@ -0,0 +1,59 @@
+import threading
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from cpilatam.snapshot import get_snapshot, get_snapshots, publish
+
+pytestmark = pytest.mark.usefixtures("restore_snapshots")
+
+DATA = pd.DataFrame(
+    {
+        "date": pd.to_datetime(["2023-01-01", "2023-02-01"]),
+        "cpi": [100.0, 101.0],
+        "reference_date": pd.to_datetime(["2018-12-01"] * 2),
+    }
+)
+
+
+def test_publish_new_version():
+    previous = get_snapshot("peru")
+    snapshot = publish("peru", DATA)
+
+    assert snapshot.version == previous.version + 1
+    assert get_snapshot("peru") is snapshot
+    # readers holding the previous version keep a consistent view
+    assert previous.data is not DATA
+    assert get_snapshots()["colombia"] is get_snapshot("colombia")
+
+
+def test_cpi_at():
+    snapshot = publish("test", DATA)
+
+    np.testing.assert_array_equal(
+        snapshot.cpi_at(["2023-02-15", "2023-01-01", "2024-01-01"]), [101, 100, np.nan]
+    )
+
+
+def test_concurrent_readers_see_complete_versions():
+    frames = [DATA.assign(cpi=DATA["cpi"] + version) for version in range(200)]
+    publish("concurrent", frames[0])
+    errors = []
+
+    def read():
+        for _ in range(2000):
+            snapshot = get_snapshot("concurrent")
+            if snapshot.index.iloc[0] != snapshot.data["cpi"].iloc[0]:
+                errors.append(snapshot.version)
+
+    readers = [threading.Thread(target=read) for _ in range(4)]
+    for reader in readers:
+        reader.start()
+    for frame in frames[1:]:
+        publish("concurrent", frame)
+    for reader in readers:
+        reader.join()
+
+    assert not errors
+    assert get_snapshot("concurrent").version == 199
@@ -0,0 +1,117 @@
+import os
+import threading
+import time
+
+import pandas as pd
+
+from cpilatam import SETTINGS
+from cpilatam.names import SourceFormat
+from cpilatam.parsers.base import BaseCPIParser, Source
+from cpilatam.storage import atomic_write_csv
+
+SOURCES = [Source(url="https://example.com/dummy.xlsx", source_format=SourceFormat.EXCEL)]
+
+
+class DummyCPIParser(BaseCPIParser):
+    downloads = 0
+    parses = 0
+
+    def fetch_source(self, source):
+        DummyCPIParser.downloads += 1
+        time.sleep(0.2)
+        return b"payload"
+
+    def read(self, payload, source_format=None):
+        return pd.DataFrame({"date": ["2023-10-01"], "cpi": [1.0], "reference_date": ["2018-12-01"]})
+
+    def normalize(self, raw, reference_date):
+        DummyCPIParser.parses += 1
+        return raw
+
+    def extract_reference_date(self, raw):
+        return pd.Timestamp("2018-12-01")
+
+
+def test_atomic_write_csv(tmp_path):
+    path = tmp_path / "cpi.csv"
+    path.write_text("date,cpi\n")
+    os.chmod(path, 0o640)
+
+    atomic_write_csv(pd.DataFrame({"date": ["2023-10-01"], "cpi": [1.0]}), path.as_posix())
+
+    assert pd.read_csv(path).shape == (1, 2)
+    assert os.stat(path).st_mode & 0o777 == 0o640
+    assert os.listdir(tmp_path) == ["cpi.csv"]
+
+
+def test_update_single_flight(tmp_path):
+    path = (tmp_path / "dummy.csv").as_posix()
+    DummyCPIParser.downloads = 0
+    DummyCPIParser.parses = 0
+    parsers = [DummyCPIParser(local_file_path=path, sources=SOURCES, country="dummy") for _ in range(4)]
+
+    threads = [threading.Thread(target=parser.update) for parser in parsers]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert DummyCPIParser.downloads == 1
+    for parser in parsers:
+        assert parser.data.shape == (1, 3)
+
+
+def test_update_reuses_recent_check(tmp_path, monkeypatch):
+    path = (tmp_path / "dummy.csv").as_posix()
+    monkeypatch.setattr(DummyCPIParser, "downloads", 0)
+
+    # parsers created one after the other, after the first check finished
+    for number in range(3):
+        parser = DummyCPIParser(local_file_path=path, sources=SOURCES, country="dummy")
+        # only the first one gets new data, the others load it as their starting point
+        assert parser.update() == (number == 0)
+        assert parser.data.shape == (1, 3)
+    assert DummyCPIParser.downloads == 1
+
+    monkeypatch.setattr(SETTINGS, "UPDATE_MIN_INTERVAL", 0)
+    parser.update()
+    assert DummyCPIParser.downloads == 2
+
+
+def test_update_skips_unchanged_source(tmp_path, monkeypatch):
+    path = (tmp_path / "dummy.csv").as_posix()
+    monkeypatch.setattr(DummyCPIParser, "downloads", 0)
+    monkeypatch.setattr(DummyCPIParser, "parses", 0)
+    monkeypatch.setattr(SETTINGS, "UPDATE_MIN_INTERVAL", 0)
+    parser = DummyCPIParser(local_file_path=path, sources=SOURCES, country="dummy")
+
+    assert parser.update()
+    written = os.stat(path).st_mtime_ns
+
+    # same payload: nothing is parsed nor written
+    assert not parser.update()
+    assert DummyCPIParser.parses == 1
+    assert os.stat(path).st_mtime_ns == written
+
+    # new payload with the same data: parsed but not written
+    monkeypatch.setattr(DummyCPIParser, "fetch_source", lambda self, source: b"republished")
+    assert not parser.update()
+    assert DummyCPIParser.parses == 2
+    assert os.stat(path).st_mtime_ns == written
+
+    # a new parser loads the local file, which is not new data
+    fresh = DummyCPIParser(local_file_path=path, sources=SOURCES, country="dummy")
+    assert not fresh.update()
+    assert fresh.get_data().shape == (1, 3)
+    assert DummyCPIParser.parses == 2
+
+    # the local file saved by another process is new data
+    os.utime(path, ns=(written, written + 1))
+    assert parser.update()
+    written = os.stat(path).st_mtime_ns
+
+    # a new version of the parser parses the same payload again
+    monkeypatch.setattr("cpilatam.parsers.base.PARSER_VERSION", 0)
+    assert not parser.update()
+    assert DummyCPIParser.parses == 3
+    assert os.stat(path).st_mtime_ns == written